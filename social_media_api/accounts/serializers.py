@@ -1,10 +1,59 @@
+from urllib.parse import urljoin
+
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
 from rest_framework.authtoken.models import Token
 
 User = get_user_model()
 
 
+def request_user_follows(context, user):
+    """
+    Return True if the requesting user follows ``user``.
+    The followed ids are looked up once per request and shared through
+    the serializer's root context.
+    """
+    request = context.get('request')
+    if not (request and request.user.is_authenticated):
+        return False
+    following_ids = context.get('_following_ids')
+    if following_ids is None:
+        following_ids = set(request.user.following.values_list('id', flat=True))
+        context['_following_ids'] = following_ids
+    return user.id in following_ids
+
+
+def media_base_url(context):
+    """
+    Return the origin that media links are built against.
+    Uses settings.API_BASE_URL when set; otherwise derives it from the
+    request once and shares it through the serializer's root context.
+    """
+    if settings.API_BASE_URL:
+        return settings.API_BASE_URL
+    base_url = context.get('_base_url')
+    if base_url is None:
+        request = context.get('request')
+        base_url = request.build_absolute_uri('/') if request else ''
+        context['_base_url'] = base_url
+    return base_url
+
+
+class MediaURLField(serializers.ImageField):
+    """
+    Image field whose links are joined onto the shared media base instead
+    of calling request.build_absolute_uri for every row. URLs the storage
+    already returns absolute (S3/CDN backends) are passed through as is.
+    """
+    def to_representation(self, value):
+        if not value:
+            return None
+        if not getattr(self, 'use_url', True):
+            return value.name
+        return urljoin(media_base_url(self.context), value.url)
+
+
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """
     Serializer for user registration.
@@ -117,6 +166,7 @@ class UserDetailSerializer(serializers.ModelSerializer):
     Serializer for user details.
     Displays user profile information.
     """
+    profile_picture = MediaURLField(required=False, allow_null=True)
     followers_count = serializers.SerializerMethodField()
     following_count = serializers.SerializerMethodField()
 
@@ -131,11 +181,14 @@ class UserDetailSerializer(serializers.ModelSerializer):
 
     def get_followers_count(self, obj):
         """Return the count of followers."""
-        return obj.followers.count()
+        # Use the view's annotation when the queryset provides one
+        count = getattr(obj, 'followers_total', None)
+        return obj.followers.count() if count is None else count
 
     def get_following_count(self, obj):
         """Return the count of users this user is following."""
-        return obj.following.count()
+        count = getattr(obj, 'following_total', None)
+        return obj.following.count() if count is None else count
 
 
 class UserProfileUpdateSerializer(serializers.ModelSerializer):
@@ -168,6 +221,7 @@ class FollowingListSerializer(serializers.ModelSerializer):
     """
     Serializer for displaying the list of users that a user is following.
     """
+    profile_picture = MediaURLField(read_only=True)
     is_following = serializers.SerializerMethodField()
 
     class Meta:
@@ -177,16 +231,14 @@ class FollowingListSerializer(serializers.ModelSerializer):
 
     def get_is_following(self, obj):
         """Check if the current user is following this user."""
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return obj.followers.filter(id=request.user.id).exists()
-        return False
+        return request_user_follows(self.context, obj)
 
 
 class FollowersListSerializer(serializers.ModelSerializer):
     """
     Serializer for displaying the list of users that follow a user.
     """
+    profile_picture = MediaURLField(read_only=True)
     is_following = serializers.SerializerMethodField()
 
     class Meta:
@@ -196,10 +248,7 @@ class FollowersListSerializer(serializers.ModelSerializer):
 
     def get_is_following(self, obj):
         """Check if the current user is following this user."""
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return obj.followers.filter(id=request.user.id).exists()
-        return False
+        return request_user_follows(self.context, obj)
 
 
 class FollowActionResponseSerializer(serializers.Serializer):
@@ -7,7 +7,10 @@ app_name = 'accounts'
 router = DefaultRouter()
 router.register(r'users', views.UserViewSet, basename='user')
 
-urlpatterns = [
+# Reverse these routes by their unique name (e.g. 'accounts:follow-user'),
+# never by view callable, so reverse() stays a single dictionary lookup.
+
+urlpatterns = (
     # Authentication endpoints
     path('register/', views.UserRegistrationView.as_view(), name='register'),
     path('login/', views.UserLoginView.as_view(), name='login'),
@@ -15,17 +18,13 @@ urlpatterns = [
     
     # Profile endpoints
     path('profile/', views.UserProfileView.as_view(), name='user-profile'),
-    path('users/<int:id>/', views.UserDetailView.as_view(), name='user-detail'),
     
-    # Follow/Unfollow endpoints - Primary paths
+    # Follow/Unfollow endpoints
     path('follow/<int:user_id>/', views.follow_user_view, name='follow-user'),
     path('unfollow/<int:user_id>/', views.unfollow_user_view, name='unfollow-user'),
     
-    # Follow/Unfollow endpoints - Alternative paths for non-router access
-    path('users/<int:user_id>/follow/', views.follow_user_view, name='follow-user-alt'),
-    path('users/<int:user_id>/unfollow/', views.unfollow_user_view, name='unfollow-user-alt'),
-    
-    # Router URLs (includes follow/unfollow from UserViewSet actions)
+    # Router URLs (user list/detail plus users/<id>/follow/ and
+    # users/<id>/unfollow/ from the UserViewSet actions)
     path('', include(router.urls)),
-]
+)
 
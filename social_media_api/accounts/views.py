@@ -3,6 +3,8 @@ from rest_framework.decorators import api_view, permission_classes, action
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
 from rest_framework.generics import GenericAPIView
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
 
 from .models import CustomUser
@@ -36,7 +38,8 @@ class UserRegistrationView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
         
-        token = Token.objects.get(user=user)
+        # The serializer created the token; creating it cached it on the user
+        token = user.auth_token
         
         return Response(
             {
@@ -108,17 +111,6 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
         )
 
 
-class UserDetailView(generics.RetrieveAPIView):
-    """
-    API view for retrieving a specific user's profile.
-    GET /api/auth/users/<user_id>/ - Get user profile by ID
-    """
-    queryset = CustomUser.objects.all()
-    serializer_class = UserDetailSerializer
-    permission_classes = [permissions.IsAuthenticated]
-    lookup_field = 'id'
-
-
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def logout_view(request):
@@ -158,6 +150,28 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = 'id'
 
+    def get_queryset(self):
+        """
+        Annotate follower/following counts so list and detail responses
+        don't run two COUNT queries per user.
+        Each count is a correlated subquery on the follow table, so the
+        two relations are never joined into the same row set.
+        """
+        if self.action in ('list', 'retrieve'):
+            return CustomUser.objects.annotate(
+                followers_total=self._follow_count_subquery('from_customuser'),
+                following_total=self._follow_count_subquery('to_customuser'),
+            )
+        return CustomUser.objects.all()
+
+    @staticmethod
+    def _follow_count_subquery(column):
+        """Count follow rows whose ``column`` points at the outer user."""
+        rows = CustomUser.followers.through.objects.filter(
+            **{column: OuterRef('pk')}
+        ).order_by().values(column).annotate(total=Count('*')).values('total')
+        return Coalesce(Subquery(rows, output_field=IntegerField()), 0)
+
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
         if self.action == 'follow':
@@ -350,7 +364,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
 def follow_user_view(request, user_id):
     """
     API view for following a user using a simple POST request.
-    POST /api/auth/users/<user_id>/follow/
+    POST /api/auth/follow/<user_id>/
     """
     try:
         target_user = CustomUser.objects.get(id=user_id)
@@ -395,7 +409,7 @@ def follow_user_view(request, user_id):
 def unfollow_user_view(request, user_id):
     """
     API view for unfollowing a user using a simple POST request.
-    POST /api/auth/users/<user_id>/unfollow/
+    POST /api/auth/unfollow/<user_id>/
     """
     try:
         target_user = CustomUser.objects.get(id=user_id)
@@ -6,7 +6,10 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'social_media_api.settings')
+    if len(sys.argv) > 1 and sys.argv[1] == 'test':
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'social_media_api.settings_test')
+    else:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'social_media_api.settings')
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
@@ -33,8 +33,8 @@ class NotificationAdmin(admin.ModelAdmin):
 @admin.register(NotificationPreference)
 class NotificationPreferenceAdmin(admin.ModelAdmin):
     """Admin interface for NotificationPreference model."""
-    list_display = ('user', 'follow_notifications', 'like_notifications', 'comment_notifications')
-    list_filter = ('follow_notifications', 'like_notifications', 'comment_notifications', 'reply_notifications', 'mention_notifications')
+    list_display = ('user', 'notify_on_follow', 'notify_on_like', 'notify_on_comment')
+    list_filter = ('notify_on_follow', 'notify_on_like', 'notify_on_comment', 'notify_on_reply', 'notify_on_mention')
     search_fields = ('user__email', 'user__username')
     
     fieldsets = (
@@ -43,11 +43,11 @@ class NotificationPreferenceAdmin(admin.ModelAdmin):
         }),
         ('Notification Preferences', {
             'fields': (
-                'follow_notifications',
-                'like_notifications',
-                'comment_notifications',
-                'mention_notifications',
-                'reply_notifications',
+                'notify_on_follow',
+                'notify_on_like',
+                'notify_on_comment',
+                'notify_on_mention',
+                'notify_on_reply',
             ),
             'description': 'Enable or disable notifications for each type of activity.',
         }),
@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -85,7 +87,8 @@ class Notification(models.Model):
         indexes = [
             models.Index(fields=["timestamp"]),
             models.Index(fields=['recipient', '-created_at']),
-            models.Index(fields=['recipient', 'is_read']),
+            # Serves ?unread= lists in order and, by prefix, unread counts
+            models.Index(fields=['recipient', 'is_read', '-created_at']),
         ]
         verbose_name = 'Notification'
         verbose_name_plural = 'Notifications'
@@ -102,19 +105,57 @@ class Notification(models.Model):
         action = action_map.get(self.verb, 'interacted with you')
         return f'{self.actor.username} {action}'
     
+    # Message templates for each verb, formatted with the actor's username
+    MESSAGE_TEMPLATES = {
+        'follow': '{actor} started following you',
+        'like': '{actor} liked your post',
+        'comment': '{actor} commented on your post',
+        'mention': '{actor} mentioned you',
+        'reply': '{actor} replied to your comment',
+    }
+    
+    # Seconds a user's unread count stays cached between invalidations
+    UNREAD_COUNT_CACHE_TIMEOUT = 5 * 60
+    
+    @staticmethod
+    def _unread_count_cache_key(user_id):
+        return f'notifications:unread-count:{user_id}'
+    
+    @classmethod
+    def get_unread_count(cls, user):
+        """
+        Return the user's unread count, served from the cache when warm.
+        Only a shared cache is used: a per-process one would keep serving
+        counts that other workers' writes have already changed.
+        """
+        if not settings.SHARED_CACHE:
+            return cls.objects.filter(recipient=user, is_read=False).count()
+        return cache.get_or_set(
+            cls._unread_count_cache_key(user.pk),
+            lambda: cls.objects.filter(recipient=user, is_read=False).count(),
+            cls.UNREAD_COUNT_CACHE_TIMEOUT,
+        )
+    
+    @classmethod
+    def invalidate_unread_count(cls, *user_ids):
+        """
+        Drop the given users' cached unread counts in one cache call. Saves
+        do this through a signal; call it directly after queryset update(),
+        delete() or bulk_create().
+        """
+        if settings.SHARED_CACHE and user_ids:
+            cache.delete_many([cls._unread_count_cache_key(user_id) for user_id in user_ids])
+    
+    @classmethod
+    def build_message(cls, verb, actor_name):
+        """Build the message for a verb without needing a model instance."""
+        template = cls.MESSAGE_TEMPLATES.get(verb, '{actor} interacted with you')
+        return template.format(actor=actor_name)
+    
     @property
     def get_notification_message(self):
         """Generate a human-readable notification message."""
-        actor_name = self.actor.username
-        
-        message_map = {
-            'follow': f'{actor_name} started following you',
-            'like': f'{actor_name} liked your post',
-            'comment': f'{actor_name} commented on your post',
-            'mention': f'{actor_name} mentioned you',
-            'reply': f'{actor_name} replied to your comment',
-        }
-        return message_map.get(self.verb, f'{actor_name} interacted with you')
+        return self.build_message(self.verb, self.actor.username)
     
     @property
     def get_related_object_url(self):
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from accounts.models import CustomUser
+from accounts.serializers import MediaURLField
 from .models import Notification, NotificationPreference
 
 
@@ -7,9 +8,11 @@ class ActorSerializer(serializers.ModelSerializer):
     """
     Serializer for the actor (user who performed the action).
     """
+    profile_picture = MediaURLField(read_only=True)
+
     class Meta:
         model = CustomUser
-        fields = ['id', 'username', 'email', 'first_name', 'last_name', 'profile_picture']
+        fields = ('id', 'username', 'email', 'first_name', 'last_name', 'profile_picture')
         read_only_fields = fields
 
 
@@ -24,7 +27,7 @@ class NotificationSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Notification
-        fields = [
+        fields = (
             'id',
             'recipient',
             'actor',
@@ -35,8 +38,8 @@ class NotificationSerializer(serializers.ModelSerializer):
             'is_read',
             'created_at',
             'updated_at',
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             'id',
             'recipient',
             'actor',
@@ -46,7 +49,7 @@ class NotificationSerializer(serializers.ModelSerializer):
             'target_id',
             'created_at',
             'updated_at',
-        ]
+        )
     
     def get_notification_message(self, obj):
         """Get human-readable notification message."""
@@ -74,7 +77,7 @@ class NotificationDetailSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Notification
-        fields = [
+        fields = (
             'id',
             'recipient',
             'actor',
@@ -85,7 +88,7 @@ class NotificationDetailSerializer(serializers.ModelSerializer):
             'is_read',
             'created_at',
             'updated_at',
-        ]
+        )
         read_only_fields = fields
     
     def get_notification_message(self, obj):
@@ -124,7 +127,7 @@ class NotificationPreferenceSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = NotificationPreference
-        fields = [
+        fields = (
             'id',
             'user',
             'notify_on_follow',
@@ -137,8 +140,8 @@ class NotificationPreferenceSerializer(serializers.ModelSerializer):
             'email_on_comment',
             'created_at',
             'updated_at',
-        ]
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+        )
+        read_only_fields = ('id', 'user', 'created_at', 'updated_at')
 
 
 class NotificationListSerializer(serializers.ModelSerializer):
@@ -150,14 +153,14 @@ class NotificationListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Notification
-        fields = [
+        fields = (
             'id',
             'actor_username',
             'verb',
             'notification_message',
             'is_read',
             'created_at',
-        ]
+        )
         read_only_fields = fields
     
     def get_notification_message(self, obj):
@@ -1,4 +1,4 @@
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 from django.contrib.contenttypes.models import ContentType
 from accounts.models import CustomUser
@@ -34,7 +34,7 @@ def like_created_signal(sender, instance, created, **kwargs):
                 preference = NotificationPreference.objects.get(
                     user=instance.post.author
                 )
-                if not preference.like_notifications:
+                if not preference.notify_on_like:
                     return
             except NotificationPreference.DoesNotExist:
                 # Create default preferences if they don't exist
@@ -67,7 +67,7 @@ def comment_created_signal(sender, instance, created, **kwargs):
                 preference = NotificationPreference.objects.get(
                     user=instance.post.author
                 )
-                if not preference.comment_notifications:
+                if not preference.notify_on_comment:
                     return
             except NotificationPreference.DoesNotExist:
                 NotificationPreference.objects.create(user=instance.post.author)
@@ -91,7 +91,7 @@ def comment_created_signal(sender, instance, created, **kwargs):
                     preference = NotificationPreference.objects.get(
                         user=parent_author
                     )
-                    if not preference.reply_notifications:
+                    if not preference.notify_on_reply:
                         return
                 except NotificationPreference.DoesNotExist:
                     NotificationPreference.objects.create(user=parent_author)
@@ -111,30 +111,64 @@ def create_follow_notification(sender, instance, action, reverse, model, pk_set,
     Signal to create notification when user is followed.
     
     This signal connects to the m2m_changed signal for the followers relationship.
+    Either side can send it: followed.followers.add(follower) arrives with
+    reverse=False and the followed user as instance, while
+    follower.following.add(followed) arrives with reverse=True and the
+    follower as instance.
     """
     if action == 'post_add':
-        # instance is the user being followed
-        # pk_set contains the IDs of users doing the following
+        if reverse:
+            # instance followed every user in pk_set
+            follows = [(followed_id, instance.pk) for followed_id in pk_set]
+        else:
+            # every user in pk_set followed instance
+            follows = [(instance.pk, follower_id) for follower_id in pk_set]
+        recipient_ids = {recipient_id for recipient_id, _ in follows}
         
-        for follower_id in pk_set:
-            follower = CustomUser.objects.get(id=follower_id)
-            
-            # Check if the followed user has follow notifications enabled
-            try:
-                preference = NotificationPreference.objects.get(
-                    user=instance
-                )
-                if not preference.follow_notifications:
-                    continue
-            except NotificationPreference.DoesNotExist:
-                NotificationPreference.objects.create(user=instance)
-            
-            # Create the notification
-            Notification.objects.create(
-                recipient=instance,
-                actor=follower,
+        # Check each followed user's preference in one query, creating
+        # defaults for users who have none yet
+        preferences = dict(
+            NotificationPreference.objects.filter(
+                user_id__in=recipient_ids
+            ).values_list('user_id', 'notify_on_follow')
+        )
+        NotificationPreference.objects.bulk_create([
+            NotificationPreference(user_id=user_id)
+            for user_id in recipient_ids - preferences.keys()
+        ])
+        muted_ids = {user_id for user_id, enabled in preferences.items() if not enabled}
+        
+        # Create one notification per follow in a single INSERT
+        Notification.objects.bulk_create([
+            Notification(
+                recipient_id=recipient_id,
+                actor_id=actor_id,
                 verb='follow',
             )
+            for recipient_id, actor_id in follows
+            if recipient_id not in muted_ids
+        ])
+        # bulk_create skips post_save, so drop the cached counts here
+        Notification.invalidate_unread_count(*(recipient_ids - muted_ids))
+
+
+@receiver(post_save, sender=Notification)
+def notification_changed_signal(sender, instance, **kwargs):
+    """
+    Keep the recipient's cached unread count in step with their rows.
+    Deletes are invalidated by their callers instead: a delete receiver
+    would stop Django from fast-deleting notifications in bulk.
+    """
+    Notification.invalidate_unread_count(instance.recipient_id)
+
+
+@receiver(pre_delete, sender=CustomUser)
+def actor_deleted_signal(sender, instance, **kwargs):
+    """Drop the counts of users whose unread notifications cascade with their actor."""
+    Notification.invalidate_unread_count(*set(
+        Notification.objects.filter(actor=instance, is_read=False)
+        .values_list('recipient_id', flat=True)
+    ))
 
 
 # Import at the end to avoid circular imports
@@ -142,7 +176,7 @@ from django.db.models.signals import m2m_changed
 from .apps import NotificationsConfig
 
 # Connect the m2m_changed signal for followers
-CustomUser.followers.through.m2m_changed.connect(
+m2m_changed.connect(
     create_follow_notification,
     sender=CustomUser.followers.through,
     weak=False
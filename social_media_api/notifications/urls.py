@@ -6,10 +6,10 @@ from .views import NotificationViewSet, NotificationPreferenceView
 router = DefaultRouter()
 router.register(r'notifications', NotificationViewSet, basename='notification')
 
-urlpatterns = [
+urlpatterns = (
     # Include router URLs (provides list, retrieve, actions)
     path('', include(router.urls)),
     
     # Notification preferences endpoints
     path('preferences/', NotificationPreferenceView.as_view(), name='notification-preferences'),
-]
+)
@@ -1,9 +1,7 @@
-from rest_framework import viewsets, generics, status, permissions
+from rest_framework import viewsets, generics, status, permissions, serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
-from django.utils import timezone
-from django.db.models import Q
+from rest_framework.pagination import CursorPagination
 
 from .models import Notification, NotificationPreference
 from .serializers import (
@@ -15,8 +13,13 @@ from .serializers import (
 )
 
 
-class NotificationPagination(PageNumberPagination):
-    """Custom pagination for notifications."""
+class NotificationPagination(CursorPagination):
+    """
+    Keyset pagination for notifications, newest first.
+    Each page seeks past the previous cursor on the (recipient, ...,
+    created_at) indexes instead of counting and skipping OFFSET rows.
+    """
+    ordering = '-created_at'
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
@@ -36,7 +39,11 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = NotificationPagination
+    # Ordering is fixed by the cursor; OrderingFilter would hand it None
+    filter_backends = []
     lookup_field = 'id'
+    # Columns read by list(); same payload as NotificationListSerializer
+    list_values_fields = ('id', 'actor__username', 'verb', 'is_read', 'created_at')
     
     def get_queryset(self):
         """Get notifications for the current user."""
@@ -73,13 +80,34 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         if verb:
             queryset = queryset.filter(verb=verb)
         
+        # Plain rows are enough for the lightweight list payload
+        queryset = queryset.values(*self.list_values_fields)
+        
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            return self.get_paginated_response(self.build_list_rows(page))
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return Response(self.build_list_rows(queryset))
+    
+    def build_list_rows(self, rows):
+        """
+        Build the list payload from values() rows, matching the fields of
+        NotificationListSerializer without instantiating any models.
+        """
+        created_at = serializers.DateTimeField()
+        return [
+            {
+                'id': row['id'],
+                'actor_username': row['actor__username'],
+                'verb': row['verb'],
+                'notification_message': Notification.build_message(
+                    row['verb'], row['actor__username']
+                ),
+                'is_read': row['is_read'],
+                'created_at': created_at.to_representation(row['created_at']),
+            }
+            for row in rows
+        ]
     
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def mark_read(self, request, id=None):
@@ -96,8 +124,10 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        notification.is_read = True
-        notification.save()
+        if not notification.is_read:
+            notification.is_read = True
+            # Write only the changed column (plus the auto_now timestamp)
+            notification.save(update_fields=['is_read', 'updated_at'])
         
         serializer = self.get_serializer(notification)
         return Response(
@@ -118,6 +148,7 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
             recipient=request.user,
             is_read=False
         ).update(is_read=True)
+        Notification.invalidate_unread_count(request.user.pk)
         
         return Response(
             {
@@ -133,10 +164,8 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         Get count of unread notifications.
         GET /api/notifications/unread_count/
         """
-        count = Notification.objects.filter(
-            recipient=request.user,
-            is_read=False
-        ).count()
+        # Clients poll this; the count is cached and invalidated on writes
+        count = Notification.get_unread_count(request.user)
         
         return Response(
             {
@@ -169,21 +198,19 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
             recipient=request.user
         )
         
-        if not notifications.exists():
-            return Response(
-                {'error': 'No matching notifications found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
+        # Each action is a single statement whose row count also tells us
+        # whether anything matched, so no separate EXISTS/COUNT is needed
         if action == 'mark_read':
             count = notifications.update(is_read=True)
+            Notification.invalidate_unread_count(request.user.pk)
             message = f'Marked {count} notification(s) as read'
         elif action == 'mark_unread':
             count = notifications.update(is_read=False)
+            Notification.invalidate_unread_count(request.user.pk)
             message = f'Marked {count} notification(s) as unread'
         elif action == 'delete':
-            count = notifications.count()
-            notifications.delete()
+            count = notifications.delete()[0]
+            Notification.invalidate_unread_count(request.user.pk)
             message = f'Deleted {count} notification(s)'
         else:
             return Response(
@@ -191,6 +218,12 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        if not count:
+            return Response(
+                {'error': 'No matching notifications found.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
         return Response(
             {
                 'message': message,
@@ -206,6 +239,7 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         DELETE /api/notifications/clear_all/
         """
         count = Notification.objects.filter(recipient=request.user).delete()[0]
+        Notification.invalidate_unread_count(request.user.pk)
         
         return Response(
             {
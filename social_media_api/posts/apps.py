@@ -8,3 +8,19 @@ class PostsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'posts'
     verbose_name = 'Posts'
+
+    def ready(self):
+        """
+        Connect signal handlers and warm the URL resolver so the first
+        request doesn't pay for it.
+        """
+        import posts.signals  # noqa
+        from django.conf import settings
+        from django.urls import get_resolver
+        from django.utils import translation
+
+        # Reading reverse_dict imports the URLconf and builds the resolver's
+        # lookup tables for the active language. Only LANGUAGE_CODE is ever
+        # active here (no LocaleMiddleware), so that is the one to warm.
+        with translation.override(settings.LANGUAGE_CODE):
+            get_resolver().reverse_dict
@@ -0,0 +1,106 @@
+"""
+Page caching for the public post feeds.
+
+Cached pages are keyed under a version per feed scope: one for explore/
+and one per author for feed/<username>/. Post, like, comment, profile and
+follow writes store a new version only for the scopes whose pages render
+them (see posts.signals), so the next request for those feeds misses and
+rebuilds, while every other author's pages stay cached. The same version
+doubles as the pages' ETag.
+
+Invalidation only reaches other workers through a shared backend, so the
+pages are served uncached unless settings.SHARED_CACHE is set.
+"""
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import etag
+from django.views.decorators.vary import vary_on_headers
+
+# Seconds the public read-only feeds are served from the cache
+PUBLIC_FEED_CACHE_TIMEOUT = 30
+
+FEED_CACHE_VERSION_KEY = 'posts:feed-version:{scope}'
+
+# Seconds a feed version is kept. Any path can create one (feed/<username>/
+# is public), so versions must expire; an expired version just starts a new
+# cache generation, as each version is a fresh timestamp.
+FEED_CACHE_VERSION_TIMEOUT = 60 * 60
+
+EXPLORE_FEED_SCOPE = 'explore'
+
+
+def _new_version():
+    return time.time_ns()
+
+
+def author_feed_scope(username):
+    """Scope of the feed/<username>/ pages."""
+    return f'author:{username}'
+
+
+def explore_scope(request, *args, **kwargs):
+    """Scope resolver for explore/."""
+    return EXPLORE_FEED_SCOPE
+
+
+def user_feed_scope(request, *args, **kwargs):
+    """Scope resolver for feed/<username>/."""
+    return author_feed_scope(kwargs['username'])
+
+
+def get_feed_cache_version(scope):
+    """Return the scope's current version, starting a new one if none is stored."""
+    return cache.get_or_set(
+        FEED_CACHE_VERSION_KEY.format(scope=scope), _new_version, FEED_CACHE_VERSION_TIMEOUT
+    )
+
+
+def bump_feed_cache_versions(scopes):
+    """Invalidate the cached pages of the given scopes by moving them to new versions."""
+    version = _new_version()
+    cache.set_many(
+        {FEED_CACHE_VERSION_KEY.format(scope=scope): version for scope in scopes},
+        FEED_CACHE_VERSION_TIMEOUT,
+    )
+
+
+def public_feed_cache(view, scope):
+    """
+    Cache a public feed response briefly and answer conditional GETs
+    with 304 while the feed's version is unchanged. ``scope`` maps the
+    request to the feed scope its pages are versioned under.
+
+    Responses still carry per-user fields (is_liked_by_user, is_following),
+    so cached pages vary on the token header: anonymous requests share one
+    entry, and authenticated ones are cached per token. Vary is set both
+    inside cache_page, which keys the stored page on it, and outside etag,
+    so 304 responses carry it too.
+    """
+    vary_on_authorization = vary_on_headers('Authorization')
+    view = vary_on_authorization(view)
+
+    def version(request, *args, **kwargs):
+        return get_feed_cache_version(scope(request, *args, **kwargs))
+
+    def feed_etag(request, *args, **kwargs):
+        return str(version(request, *args, **kwargs))
+
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        key_prefix = f'feed-{scope(request, *args, **kwargs)}-v{version(request, *args, **kwargs)}'
+        cached_view = cache_page(PUBLIC_FEED_CACHE_TIMEOUT, key_prefix=key_prefix)(view)
+        return cached_view(request, *args, **kwargs)
+
+    cached_feed = vary_on_authorization(etag(feed_etag)(wrapped))
+
+    @wraps(view)
+    def dispatch(request, *args, **kwargs):
+        if not settings.SHARED_CACHE:
+            return view(request, *args, **kwargs)
+        return cached_feed(request, *args, **kwargs)
+
+    return dispatch
@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.urls import get_resolver
+
+# Namespaces API clients never call
+EXCLUDED_NAMESPACES = ('admin',)
+
+
+def collect_routes(resolver, prefix='', namespace=''):
+    """
+    Map every named route under resolver to a URL template such as
+    '/api/posts/{id}/', recursing into namespaced includes.
+    """
+    routes = {}
+    for name in resolver.reverse_dict:
+        # reverse_dict is also keyed by view callables; only names are useful
+        if not isinstance(name, str):
+            continue
+        # Prefer the plainest form, e.g. skip the router's .<format> suffix variant
+        url_format, params = min(
+            (possibility for entry in resolver.reverse_dict.getlist(name) for possibility in entry[0]),
+            key=lambda possibility: len(possibility[1]),
+        )
+        template = url_format % {param: '{%s}' % param for param in params}
+        routes[f'{namespace}{name}'] = f'/{prefix}{template}'
+    for ns, (ns_prefix, ns_resolver) in resolver.namespace_dict.items():
+        if ns in EXCLUDED_NAMESPACES:
+            continue
+        routes.update(collect_routes(ns_resolver, prefix + ns_prefix, f'{namespace}{ns}:'))
+    return routes
+
+
+class Command(BaseCommand):
+    """
+    Write a JSON manifest of route name -> URL template, so clients can
+    build API URLs locally instead of hard-coding or looking them up.
+    """
+    help = 'Write a JSON manifest of named API routes to STATIC_ROOT/urls.json.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=str(Path(settings.STATIC_ROOT) / 'urls.json'),
+            help='File to write the manifest to (default: STATIC_ROOT/urls.json).',
+        )
+
+    def handle(self, *args, **options):
+        routes = collect_routes(get_resolver())
+        output = Path(options['output'])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(dict(sorted(routes.items())), indent=2))
+        self.stdout.write(self.style.SUCCESS(f'Wrote {len(routes)} routes to {output}'))
@@ -1,6 +1,5 @@
 from django.db import models
 from django.contrib.auth import get_user_model
-from django.utils import timezone
 
 User = get_user_model()
 
@@ -98,6 +97,9 @@ class Like(models.Model):
         verbose_name = "Like"
         verbose_name_plural = "Likes"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['post', '-created_at'], name='posts_like_post_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} liked post by {self.post.author.username}"
@@ -162,7 +164,7 @@ class Comment(models.Model):
     
     def is_reply(self):
         """Check if this comment is a reply to another comment."""
-        return self.parent_comment is not None
+        return self.parent_comment_id is not None
     
     def get_reply_count(self):
         """Get number of replies to this comment."""
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db.models import Prefetch
+from accounts.serializers import MediaURLField, request_user_follows
 from .models import Post, Like, Comment
 
 User = get_user_model()
@@ -10,6 +12,7 @@ class AuthorSerializer(serializers.ModelSerializer):
     Serializer for displaying author information in posts and comments.
     """
     is_following = serializers.SerializerMethodField()
+    profile_picture = MediaURLField(read_only=True)
 
     class Meta:
         model = User
@@ -18,10 +21,7 @@ class AuthorSerializer(serializers.ModelSerializer):
 
     def get_is_following(self, obj):
         """Check if the current user is following this author."""
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return obj.followers.filter(id=request.user.id).exists()
-        return False
+        return request_user_follows(self.context, obj)
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -53,7 +53,10 @@ class CommentSerializer(serializers.ModelSerializer):
     def get_replies(self, obj):
         """Get immediate replies to this comment."""
         if not obj.is_reply():
-            replies = obj.replies.select_related('author').order_by('-created_at')
+            # Use prefetched replies when the view loaded them
+            replies = obj.replies.all()
+            if 'replies' not in getattr(obj, '_prefetched_objects_cache', {}):
+                replies = replies.select_related('author')
             return CommentSerializer(replies, many=True, context=self.context).data
         return []
     
@@ -106,6 +109,23 @@ class PostSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'created_at', 'updated_at', 'author', 'likes', 'comments')
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Prefetch the nested likes and comments (and the comments' replies)
+        together with their users, so serializing N posts costs a fixed
+        number of queries.
+        """
+        return queryset.select_related('author').prefetch_related(
+            Prefetch('likes', queryset=Like.objects.select_related('user')),
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.select_related('author').prefetch_related(
+                    Prefetch('replies', queryset=Comment.objects.select_related('author')),
+                ),
+            ),
+        )
+
     def get_likes_count(self, obj):
         """Return the count of likes."""
         return obj.likes.count()
@@ -118,7 +138,8 @@ class PostSerializer(serializers.ModelSerializer):
         """Check if the current user has liked this post."""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            return obj.likes.filter(user=request.user).exists()
+            # Scan the prefetched likes instead of querying once per post
+            return any(like.user_id == request.user.id for like in obj.likes.all())
         return False
 
     def create(self, validated_data):
@@ -146,6 +167,21 @@ class FeedPostSerializer(serializers.ModelSerializer):
         )
         read_only_fields = fields
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Join the author but load only the columns the feed renders,
+        skipping the password hash, permission flags and the like.
+        """
+        author_fields = [
+            f'author__{field}' for field in AuthorSerializer.Meta.fields
+            if field != 'is_following'
+        ]
+        return queryset.select_related('author').only(
+            'author', 'content', 'image', 'created_at', 'updated_at',
+            *author_fields,
+        ).prefetch_related('likes', 'comments')
+
     def get_likes_count(self, obj):
         """Return the count of likes."""
         return obj.likes.count()
@@ -158,7 +194,8 @@ class FeedPostSerializer(serializers.ModelSerializer):
         """Check if the current user has liked this post."""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            return obj.likes.filter(user=request.user).exists()
+            # Scan the prefetched likes instead of querying once per post
+            return any(like.user_id == request.user.id for like in obj.likes.all())
         return False
 
 
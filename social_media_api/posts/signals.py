@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from accounts.models import CustomUser
+from .caching import EXPLORE_FEED_SCOPE, author_feed_scope, bump_feed_cache_versions
+from .models import Post, Like, Comment
+
+
+def invalidate_author_feeds(usernames):
+    """Drop cached explore pages and the feed pages of the given authors."""
+    if not settings.SHARED_CACHE:
+        # Feed pages are not cached, so there is nothing to drop
+        return
+    bump_feed_cache_versions(
+        [EXPLORE_FEED_SCOPE, *(author_feed_scope(username) for username in usernames)]
+    )
+
+
+@receiver([post_save, post_delete], sender=Post)
+def invalidate_post_feeds(sender, instance, **kwargs):
+    """A post shows up on explore and on its author's feed."""
+    invalidate_author_feeds([instance.author.username])
+
+
+@receiver([post_save, post_delete], sender=Like)
+@receiver([post_save, post_delete], sender=Comment)
+def invalidate_post_counts(sender, instance, **kwargs):
+    """Likes and comments change the counts rendered on their post's feeds."""
+    invalidate_author_feeds(
+        Post.objects.filter(pk=instance.post_id).values_list('author__username', flat=True)
+    )
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_profile_feeds(sender, instance, **kwargs):
+    """Profile fields are rendered as the author of the user's posts."""
+    invalidate_author_feeds([instance.username])
+
+
+@receiver(m2m_changed, sender=CustomUser.followers.through)
+def invalidate_follow_feeds(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    is_following changes on the pages of the followed users, so only
+    their feeds (and explore) are dropped.
+    """
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    if not reverse:
+        # instance.followers changed: instance is the followed user
+        usernames = [instance.username]
+    elif pk_set is not None:
+        usernames = CustomUser.objects.filter(pk__in=pk_set).values_list('username', flat=True)
+    else:
+        # following.clear() sends no pk_set; read who is about to be unfollowed
+        usernames = instance.following.values_list('username', flat=True)
+    invalidate_author_feeds(usernames)
@@ -1,20 +1,19 @@
 from rest_framework import status, viewsets, generics, permissions
 from rest_framework.decorators import api_view, permission_classes, action
 from rest_framework.response import Response
-from django.db.models import Q, Prefetch
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from django.contrib.contenttypes.models import ContentType
+from django.http import StreamingHttpResponse
 
 from .models import Post, Like, Comment
-from notifications.models import Notification
 from .serializers import (
     PostSerializer,
     PostCreateSerializer,
     FeedPostSerializer,
     CommentSerializer,
-    LikeSerializer,
 )
+from social_media_api.renderers import ORJSONRenderer
+
+# Posts fetched per database round-trip when streaming the feed
+FEED_STREAM_CHUNK_SIZE = 500
 
 
 class PostViewSet(viewsets.ModelViewSet):
@@ -47,11 +46,7 @@ class PostViewSet(viewsets.ModelViewSet):
         """
         Optimize queryset with select_related and prefetch_related.
         """
-        queryset = Post.objects.select_related('author').prefetch_related(
-            'likes',
-            Prefetch('comments', queryset=Comment.objects.select_related('author'))
-        )
-        return queryset
+        return PostSerializer.setup_eager_loading(Post.objects.all())
 
     def perform_create(self, serializer):
         """Set the author to the current user when creating a post."""
@@ -59,7 +54,8 @@ class PostViewSet(viewsets.ModelViewSet):
 
     def perform_update(self, serializer):
         """Ensure only the post author can update it."""
-        post = self.get_object()
+        # update() already fetched the post; don't look it up again
+        post = serializer.instance
         if post.author != self.request.user:
             raise PermissionError("You can only update your own posts.")
         serializer.save()
@@ -71,12 +67,12 @@ class PostViewSet(viewsets.ModelViewSet):
         instance.delete()
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
-    def like(self, request, pk=None):
+    def like(self, request, id=None):
         """
         Like a post.
         POST /api/posts/<id>/like/
         """
-        post = generics.get_object_or_404(Post, pk=pk)
+        post = generics.get_object_or_404(Post, pk=id)
         
         # Get or create the like
         like, created = Like.objects.get_or_create(user=request.user, post=post)
@@ -87,16 +83,7 @@ class PostViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Create notification if not self-like
-        if post.author != request.user:
-            Notification.objects.create(
-                recipient=post.author,
-                actor=request.user,
-                verb='like',
-                content_type=ContentType.objects.get_for_model(Post),
-                object_id=post.id
-            )
-        
+        # notifications.signals notifies the author, honouring their preferences
         return Response(
             {
                 'message': 'Post liked successfully',
@@ -111,7 +98,8 @@ class PostViewSet(viewsets.ModelViewSet):
         Unlike a post.
         POST /api/posts/<id>/unlike/
         """
-        post = self.get_object()
+        # Plain lookup: the eager-loaded queryset would serve a stale likes count
+        post = generics.get_object_or_404(Post, pk=id)
         
         # Check if user liked the post
         like = post.likes.filter(user=request.user).first()
@@ -144,7 +132,8 @@ class PostViewSet(viewsets.ModelViewSet):
             "parent_comment": null  // Optional: ID of parent comment for nested reply
         }
         """
-        post = self.get_object()
+        # Only the post row is needed; skip the viewset's eager loading
+        post = generics.get_object_or_404(Post, pk=id)
         
         content = request.data.get('content')
         if not content:
@@ -193,7 +182,8 @@ class PostViewSet(viewsets.ModelViewSet):
         Query Parameters:
         - include_replies: Set to 'true' to include nested replies (default: true)
         """
-        post = self.get_object()
+        # The comments are queried below; don't prefetch them with the post
+        post = generics.get_object_or_404(Post, pk=id)
         
         # Get only top-level comments (parent_comment is NULL)
         comments = post.comments.filter(parent_comment__isnull=True).select_related('author').prefetch_related('replies__author').order_by('-created_at')
@@ -251,6 +241,7 @@ class FeedView(generics.ListAPIView):
     Query Parameters:
     - page: Page number for pagination
     - page_size: Number of posts per page
+    - stream: Set to 1 to stream the whole feed as newline-delimited JSON
     """
     serializer_class = FeedPostSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -267,7 +258,9 @@ class FeedView(generics.ListAPIView):
         following_users = [u.id for u in user.following.all()]
         
         # Get posts from followed users, ordered by creation date (most recent first)
-        queryset = Post.objects.filter(author__in=following_users).order_by('-created_at').select_related('author').prefetch_related('likes', 'comments')
+        queryset = FeedPostSerializer.setup_eager_loading(
+            Post.objects.filter(author__in=following_users).order_by('-created_at')
+        )
         
         return queryset
 
@@ -275,6 +268,9 @@ class FeedView(generics.ListAPIView):
         """Override list to provide custom response format."""
         queryset = self.filter_queryset(self.get_queryset())
         
+        if request.query_params.get('stream') == '1':
+            return self.stream(queryset)
+        
         serializer = self.get_serializer(queryset, many=True, context={'request': request})
         
         return Response(
@@ -285,6 +281,23 @@ class FeedView(generics.ListAPIView):
             status=status.HTTP_200_OK
         )
 
+    def stream(self, queryset):
+        """
+        Stream the feed as newline-delimited JSON, one post per line.
+        Posts are fetched and serialized a chunk at a time, so memory
+        stays flat however many posts the followed users have.
+        """
+        renderer = ORJSONRenderer()
+        # One shared context, so per-request lookups run once for the stream
+        context = self.get_serializer_context()
+        
+        def rows():
+            for post in queryset.iterator(chunk_size=FEED_STREAM_CHUNK_SIZE):
+                data = FeedPostSerializer(post, context=context).data
+                yield renderer.render(data) + b'\n'
+        
+        return StreamingHttpResponse(rows(), content_type='application/x-ndjson')
+
 
 class UserFeedView(generics.ListAPIView):
     """
@@ -303,13 +316,8 @@ class UserFeedView(generics.ListAPIView):
         """
         username = self.kwargs.get('username')
         
-        queryset = Post.objects.filter(
-            author__username=username
-        ).select_related(
-            'author'
-        ).prefetch_related(
-            'likes',
-            'comments'
+        queryset = FeedPostSerializer.setup_eager_loading(
+            Post.objects.filter(author__username=username)
         ).order_by('-created_at')
         
         return queryset
@@ -352,13 +360,8 @@ def feed_view(request):
     following_users = user.following.values_list('id', flat=True)
     
     # Get posts from followed users
-    posts = Post.objects.filter(
-        author_id__in=following_users
-    ).select_related(
-        'author'
-    ).prefetch_related(
-        'likes',
-        'comments'
+    posts = FeedPostSerializer.setup_eager_loading(
+        Post.objects.filter(author_id__in=following_users)
     ).order_by('-created_at')
     
     # Serialize the posts
@@ -388,11 +391,8 @@ def explore_view(request):
     Returns recent posts from all users, useful for discovering new content.
     """
     # Get recent posts from all users
-    posts = Post.objects.all().select_related(
-        'author'
-    ).prefetch_related(
-        'likes',
-        'comments'
+    posts = FeedPostSerializer.setup_eager_loading(
+        Post.objects.all()
     ).order_by('-created_at')[:50]  # Limit to 50 most recent
     
     # Serialize the posts
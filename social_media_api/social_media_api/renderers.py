@@ -0,0 +1,27 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Falls back to DRF's stdlib-based JSONRenderer when the client asks
+    for an indented response.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data into compact JSON bytes."""
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # DRF's encoder handles lazy strings, decimals, querysets, etc.
+        return orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
@@ -0,0 +1,99 @@
+"""
+Django test settings for social_media_api project.
+
+Used automatically by `python manage.py test`. Builds on the regular
+settings and only overrides what makes the test run faster.
+
+Tests that never touch the database should subclass
+rest_framework.test.APISimpleTestCase instead of APITestCase/TestCase,
+which skips the per-test transaction entirely.
+"""
+
+import logging
+
+from django.db.backends.signals import connection_created
+
+from .settings import *  # noqa: F401,F403
+
+# Run against an in-memory SQLite database. Django's test creation turns this
+# into a shared-cache URI, so every connection sees the same database.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        # Keep the single connection open for the whole run
+        'CONN_MAX_AGE': None,
+        'TEST': {
+            # Create the test database straight from the current models
+            # instead of replaying the migration graph on every run
+            'MIGRATE': False,
+        },
+    }
+}
+
+# SQLite tuning applied to every new connection. Durability does not matter
+# for a throwaway test database, so keep the journal and temp data in memory.
+SQLITE_PRAGMAS = (
+    'PRAGMA synchronous=OFF',
+    'PRAGMA journal_mode=MEMORY',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+)
+
+
+def _apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Run SQLITE_PRAGMAS on each freshly opened SQLite connection."""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+
+
+connection_created.connect(_apply_sqlite_pragmas, dispatch_uid='settings_test_sqlite_pragmas')
+
+# Never serve cached feed pages between tests
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+}
+
+# Test requests come in over plain HTTP; without this the production
+# SECURE_SSL_REDIRECT answers every one of them with a 301.
+SECURE_SSL_REDIRECT = False
+
+# WhiteNoise only serves collected static files, which the API tests never
+# request. Security, CSRF and clickjacking middleware stay so responses are
+# tested with the same headers and checks production applies.
+_TEST_MIDDLEWARE_EXCLUDE = frozenset({
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+})
+MIDDLEWARE = tuple(m for m in MIDDLEWARE if m not in _TEST_MIDDLEWARE_EXCLUDE)  # noqa: F405
+
+# Fast hasher for test users; PBKDF2 is needlessly slow here
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Expected 4xx responses in tests should not be formatted and written out.
+# Failing requests still raise through the test client.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'null': {
+            'class': 'logging.NullHandler',
+        },
+    },
+    'loggers': {
+        'django': {
+            'handlers': ['null'],
+            'propagate': False,
+        },
+    },
+}
+logging.disable(logging.WARNING)
+
+# Stock runner; pass --keepdb when pointing DATABASES at a file-backed database
+TEST_RUNNER = 'django.test.runner.DiscoverRunner'
@@ -7,51 +7,81 @@ Tests ensure that:
 4. All edge cases are handled properly
 """
 
-from django.test import TestCase
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
-from rest_framework.test import APIClient
-from rest_framework import status
+from rest_framework.test import APISimpleTestCase, APITestCase
+from rest_framework import serializers, status
+from rest_framework.test import APIRequestFactory
 
+from accounts.serializers import MediaURLField
 from posts.models import Post, Like, Comment
+from posts.views import PostViewSet
 from notifications.models import Notification, NotificationPreference
 
 User = get_user_model()
 
+# Shared by every fixture user; tests authenticate with force_authenticate
+TEST_PASSWORD = 'testpass123'
 
-class LikeFunctionalityTests(TestCase):
-    """Tests for the Like model and like/unlike operations."""
+
+class BaseSocialAPITestCase(APITestCase):
+    """Shared fixtures: three users and a post authored by user1."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
         # Create test users
-        self.user1 = User.objects.create_user(
+        cls.user1 = User.objects.create_user(
             username='user1',
             email='user1@test.com',
-            password='testpass123'
+            password=TEST_PASSWORD
         )
-        self.user2 = User.objects.create_user(
+        cls.user2 = User.objects.create_user(
             username='user2',
             email='user2@test.com',
-            password='testpass123'
+            password=TEST_PASSWORD
+        )
+        cls.user3 = User.objects.create_user(
+            username='user3',
+            email='user3@test.com',
+            password=TEST_PASSWORD
         )
         
         # Create test post
-        self.post = Post.objects.create(
-            author=self.user1,
+        cls.post = Post.objects.create(
+            author=cls.user1,
             content='Test post content'
         )
+        
+        # Resolve URLs once for the whole class
+        cls.post_detail_url = reverse('posts:post-detail', kwargs={'id': cls.post.pk})
+        cls.like_url = reverse('posts:post-like', kwargs={'id': cls.post.pk})
+        cls.unlike_url = reverse('posts:post-unlike', kwargs={'id': cls.post.pk})
+        cls.comment_url = reverse('posts:post-comment', kwargs={'id': cls.post.pk})
+        cls.notifications_url = reverse('notification-list')
+        cls.unread_count_url = reverse('notification-unread-count')
+        cls.mark_all_read_url = reverse('notification-mark-all-read')
+        cls.bulk_action_url = reverse('notification-bulk-action')
+        cls.preferences_url = reverse('notification-preferences')
+
+
+class LikeFunctionalityTests(BaseSocialAPITestCase):
+    """Tests for the Like model and like/unlike operations."""
     
     def test_like_post_creates_like_object(self):
         """Test that liking a post creates a Like object."""
         self.client.force_authenticate(user=self.user2)
         
-        response = self.client.post(f'/api/posts/{self.post.id}/like/')
+        response = self.client.post(self.like_url)
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Like.objects.count(), 1)
-        self.assertEqual(self.post.likes.count(), 1)
+        self.assertEqual(response.data['likes_count'], 1)
         self.assertTrue(self.post.likes.filter(user=self.user2).exists())
     
     def test_cannot_like_post_twice(self):
@@ -59,11 +89,11 @@ class LikeFunctionalityTests(TestCase):
         self.client.force_authenticate(user=self.user2)
         
         # First like should succeed
-        response1 = self.client.post(f'/api/posts/{self.post.id}/like/')
+        response1 = self.client.post(self.like_url)
         self.assertEqual(response1.status_code, status.HTTP_201_CREATED)
         
         # Second like should fail
-        response2 = self.client.post(f'/api/posts/{self.post.id}/like/')
+        response2 = self.client.post(self.like_url)
         self.assertEqual(response2.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('already liked', response2.data['error'].lower())
         self.assertEqual(Like.objects.count(), 1)
@@ -77,7 +107,7 @@ class LikeFunctionalityTests(TestCase):
         self.assertEqual(self.post.likes.count(), 1)
         
         # Unlike the post
-        response = self.client.post(f'/api/posts/{self.post.id}/unlike/')
+        response = self.client.post(self.unlike_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(Like.objects.count(), 0)
@@ -87,7 +117,7 @@ class LikeFunctionalityTests(TestCase):
         """Test that user cannot unlike a post they haven't liked."""
         self.client.force_authenticate(user=self.user2)
         
-        response = self.client.post(f'/api/posts/{self.post.id}/unlike/')
+        response = self.client.post(self.unlike_url)
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('not liked', response.data['error'].lower())
@@ -97,42 +127,35 @@ class LikeFunctionalityTests(TestCase):
         self.client.force_authenticate(user=self.user2)
         
         # Like the post
-        response = self.client.post(f'/api/posts/{self.post.id}/like/')
+        response = self.client.post(self.like_url)
         self.assertEqual(response.data['likes_count'], 1)
         
         # Unlike the post
-        response = self.client.post(f'/api/posts/{self.post.id}/unlike/')
+        response = self.client.post(self.unlike_url)
         self.assertEqual(response.data['likes_count'], 0)
     
     def test_multiple_users_can_like_same_post(self):
         """Test that multiple users can like the same post."""
-        user3 = User.objects.create_user(
-            username='user3',
-            email='user3@test.com',
-            password='testpass123'
-        )
-        
         # User2 likes post
         self.client.force_authenticate(user=self.user2)
-        response1 = self.client.post(f'/api/posts/{self.post.id}/like/')
+        response1 = self.client.post(self.like_url)
         self.assertEqual(response1.status_code, status.HTTP_201_CREATED)
         
         # User3 likes post
-        self.client.force_authenticate(user=user3)
-        response2 = self.client.post(f'/api/posts/{self.post.id}/like/')
+        self.client.force_authenticate(user=self.user3)
+        response2 = self.client.post(self.like_url)
         self.assertEqual(response2.status_code, status.HTTP_201_CREATED)
-        
-        self.assertEqual(self.post.likes.count(), 2)
+        self.assertEqual(response2.data['likes_count'], 2)
     
     def test_cannot_like_own_post_notification_skip(self):
         """Test that user can like their own post but notification is skipped."""
         self.client.force_authenticate(user=self.user1)
         
-        response = self.client.post(f'/api/posts/{self.post.id}/like/')
+        response = self.client.post(self.like_url)
         
         # Like should create successfully
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(self.post.likes.count(), 1)
+        self.assertEqual(response.data['likes_count'], 1)
         
         # But no notification should be created (user1 is the author)
         # This is handled by the signal handler
@@ -146,40 +169,236 @@ class LikeFunctionalityTests(TestCase):
         )
 
 
-class LikeNotificationIntegrationTests(TestCase):
-    """Tests for Like functionality triggering Notification creation."""
+class AuthenticationRequiredTests(APISimpleTestCase):
+    """
+    Tests that write endpoints reject unauthenticated requests.
+    
+    Authentication is checked before any object lookup, so these run
+    without a database and the post ID does not need to exist.
+    """
+    
+    def test_write_endpoints_require_authentication(self):
+        """Test that each write endpoint returns 401 without credentials."""
+        cases = [
+            ('post', reverse('posts:post-like', kwargs={'id': 1}), None),
+            ('post', reverse('posts:post-unlike', kwargs={'id': 1}), None),
+            ('post', reverse('posts:post-comment', kwargs={'id': 1}), {'content': 'Test comment'}),
+            ('post', reverse('notification-mark-all-read'), None),
+        ]
+        for method, url, data in cases:
+            with self.subTest(method=method, url=url):
+                response = getattr(self.client, method)(url, data)
+                self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class MediaURLFieldTests(APISimpleTestCase):
+    """
+    Tests that media links are joined onto the shared base URL.
+    """
+    
+    class PictureSerializer(serializers.Serializer):
+        profile_picture = MediaURLField(read_only=True)
+    
+    def represent(self, url, **context):
+        picture = type('Picture', (), {'url': url, 'name': url})()
+        data = self.PictureSerializer({'profile_picture': picture}, context=context).data
+        return data['profile_picture']
+    
+    @override_settings(API_BASE_URL='')
+    def test_relative_url_uses_request_origin(self):
+        """Test that relative storage URLs are joined onto the request's origin."""
+        request = APIRequestFactory().get('/api/posts/')
+        self.assertEqual(
+            self.represent('/media/profile_pictures/a.png', request=request),
+            'http://testserver/media/profile_pictures/a.png'
+        )
+    
+    @override_settings(API_BASE_URL='https://api.example.com')
+    def test_absolute_url_is_unchanged(self):
+        """Test that URLs the storage already returns absolute pass through."""
+        url = 'https://cdn.example.com/profile_pictures/a.png'
+        self.assertEqual(self.represent(url), url)
+
+
+class PostQueryCountTests(BaseSocialAPITestCase):
+    """Tests that post endpoints do not issue per-like or per-author queries."""
     
     def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
+        """Authenticate every request in this class as user2."""
+        self.client.force_authenticate(user=self.user2)
+    
+    def get_post_detail_query_count(self):
+        """Fetch the post detail and return how many queries it ran."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.post_detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
+    
+    def test_post_detail_query_count_does_not_grow_with_likes(self):
+        """Test that nested likes and their users are eager loaded."""
+        # bulk_create skips the like notification signal
+        Like.objects.bulk_create([Like(user=self.user2, post=self.post)])
+        baseline = self.get_post_detail_query_count()
+        
+        Like.objects.bulk_create([
+            Like(user=self.user1, post=self.post),
+            Like(user=self.user3, post=self.post),
+        ])
+        
+        self.assertEqual(self.get_post_detail_query_count(), baseline)
+    
+    def test_post_queryset_prefetches_likes_and_comments(self):
+        """Test that every post PostSerializer renders has its nested rows prefetched."""
+        Post.objects.create(author=self.user2, content='Second post')
+        
+        for post in PostViewSet().get_queryset():
+            with self.subTest(post=post.pk):
+                prefetched = getattr(post, '_prefetched_objects_cache', {})
+                self.assertIn('likes', prefetched)
+                self.assertIn('comments', prefetched)
+    
+    def test_user_posts_query_count_does_not_grow_with_posts(self):
+        """Test that listing a user's posts does not query once per post."""
+        url = f"{reverse('posts:post-user-posts')}?username={self.user1.username}"
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get(url)
         
-        # Create test users
-        self.user1 = User.objects.create_user(
-            username='user1',
-            email='user1@test.com',
-            password='testpass123'
-        )
-        self.user2 = User.objects.create_user(
-            username='user2',
-            email='user2@test.com',
-            password='testpass123'
-        )
+        Post.objects.bulk_create([
+            Post(author=self.user1, content=f'Post {i}') for i in range(2)
+        ])
+        Like.objects.bulk_create([Like(user=self.user3, post=self.post)])
         
-        # Create notification preferences with defaults
-        self.pref1 = NotificationPreference.objects.create(user=self.user1)
-        self.pref2 = NotificationPreference.objects.create(user=self.user2)
+        with self.assertNumQueries(len(baseline)):
+            response = self.client.get(url)
         
-        # Create test post
-        self.post = Post.objects.create(
-            author=self.user1,
-            content='Test post content'
-        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+
+
+class FeedStreamTests(BaseSocialAPITestCase):
+    """Tests for the newline-delimited JSON mode of the personal feed."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Have user2 follow user1, who has three posts with likes and comments."""
+        super().setUpTestData()
+        cls.user2.following.add(cls.user1)
+        extra_posts = Post.objects.bulk_create([
+            Post(author=cls.user1, content=f'Streamed post {i}') for i in range(2)
+        ])
+        # bulk_create skips the notification signals
+        Like.objects.bulk_create([
+            Like(user=user, post=post)
+            for post in (cls.post, *extra_posts)
+            for user in (cls.user2, cls.user3)
+        ])
+        Comment.objects.bulk_create([
+            Comment(author=cls.user3, post=post, content='Nice')
+            for post in (cls.post, *extra_posts)
+        ])
+        cls.stream_url = f"{reverse('posts:feed')}?stream=1"
+    
+    def setUp(self):
+        """Authenticate every request in this class as user2."""
+        self.client.force_authenticate(user=self.user2)
+    
+    def test_stream_returns_one_post_per_line(self):
+        """Test that each line of the stream is one JSON post."""
+        response = self.client.get(self.stream_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).splitlines()
+        posts = [json.loads(line) for line in lines]
+        self.assertEqual(len(posts), 3)
+        self.assertEqual({post['likes_count'] for post in posts}, {2})
+        self.assertTrue(all(post['is_liked_by_user'] for post in posts))
+    
+    def test_stream_query_count_is_fixed(self):
+        """Test that streaming does not query once per post."""
+        # following ids, posts, likes, comments, and the is_following lookup
+        with self.assertNumQueries(5):
+            response = self.client.get(self.stream_url)
+            lines = b''.join(response.streaming_content).splitlines()
+        
+        self.assertEqual(len(lines), 3)
+
+
+# The test settings use DummyCache; page caching needs a real backend.
+# One LocMemCache in one process stands in for a shared Redis cache.
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'social-media-api-tests',
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, SHARED_CACHE=True)
+class PublicFeedCacheTests(BaseSocialAPITestCase):
+    """Tests for the versioned page cache and ETags on the public feeds."""
+    
+    def setUp(self):
+        """Start every test from an empty cache, authenticated as user2."""
+        cache.clear()
+        self.client.force_authenticate(user=self.user2)
+        self.explore_url = reverse('posts:explore')
+    
+    def test_explore_sets_etag_and_vary(self):
+        """Test that the public feed is served with an ETag and Vary header."""
+        response = self.client.get(self.explore_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.has_header('ETag'))
+        self.assertIn('Authorization', response['Vary'])
+    
+    def test_matching_if_none_match_returns_304(self):
+        """Test that an unchanged feed answers a conditional GET with 304."""
+        etag = self.client.get(self.explore_url)['ETag']
+        
+        response = self.client.get(self.explore_url, HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertIn('Authorization', response['Vary'])
+    
+    def test_like_changes_etag(self):
+        """Test that liking a post invalidates the cached feed and its ETag."""
+        etag = self.client.get(self.explore_url)['ETag']
+        self.client.post(self.like_url)
+        
+        response = self.client.get(self.explore_url, HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['posts'][0]['likes_count'], 1)
+    
+    @override_settings(SHARED_CACHE=False)
+    def test_feed_is_not_cached_without_shared_cache(self):
+        """Test that a per-process cache never serves or validates feed pages."""
+        response = self.client.get(self.explore_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertEqual(cache.get('posts:feed-version:explore'), None)
+
+
+class LikeNotificationIntegrationTests(BaseSocialAPITestCase):
+    """Tests for Like functionality triggering Notification creation."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
+        
+        # Create notification preferences with defaults
+        cls.pref1 = NotificationPreference.objects.create(user=cls.user1)
+        cls.pref2 = NotificationPreference.objects.create(user=cls.user2)
     
     def test_like_creates_notification_for_post_author(self):
         """Test that liking a post creates a notification for the post author."""
         self.client.force_authenticate(user=self.user2)
         
-        response = self.client.post(f'/api/posts/{self.post.id}/like/')
+        response = self.client.post(self.like_url)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         # Check that notification was created
@@ -196,12 +415,12 @@ class LikeNotificationIntegrationTests(TestCase):
     def test_notification_respects_user_preference_disabled(self):
         """Test that notification is not created if user has disabled like notifications."""
         # Disable like notifications for user1
-        self.pref1.like_notifications = False
+        self.pref1.notify_on_like = False
         self.pref1.save()
         
         self.client.force_authenticate(user=self.user2)
         
-        response = self.client.post(f'/api/posts/{self.post.id}/like/')
+        response = self.client.post(self.like_url)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         # Check that NO notification was created
@@ -215,12 +434,12 @@ class LikeNotificationIntegrationTests(TestCase):
     def test_notification_respects_user_preference_enabled(self):
         """Test that notification is created when user preference is enabled."""
         # Ensure like notifications are enabled for user1
-        self.pref1.like_notifications = True
+        self.pref1.notify_on_like = True
         self.pref1.save()
         
         self.client.force_authenticate(user=self.user2)
         
-        response = self.client.post(f'/api/posts/{self.post.id}/like/')
+        response = self.client.post(self.like_url)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         # Check that notification was created
@@ -232,47 +451,25 @@ class LikeNotificationIntegrationTests(TestCase):
         self.assertEqual(notifications.count(), 1)
 
 
-class CommentNotificationIntegrationTests(TestCase):
+class CommentNotificationIntegrationTests(BaseSocialAPITestCase):
     """Tests for Comment functionality triggering Notification creation."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
-        # Create test users
-        self.user1 = User.objects.create_user(
-            username='user1',
-            email='user1@test.com',
-            password='testpass123'
-        )
-        self.user2 = User.objects.create_user(
-            username='user2',
-            email='user2@test.com',
-            password='testpass123'
-        )
-        self.user3 = User.objects.create_user(
-            username='user3',
-            email='user3@test.com',
-            password='testpass123'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
         
         # Create notification preferences
-        self.pref1 = NotificationPreference.objects.create(user=self.user1)
-        self.pref2 = NotificationPreference.objects.create(user=self.user2)
-        self.pref3 = NotificationPreference.objects.create(user=self.user3)
-        
-        # Create test post
-        self.post = Post.objects.create(
-            author=self.user1,
-            content='Test post content'
-        )
+        cls.pref1 = NotificationPreference.objects.create(user=cls.user1)
+        cls.pref2 = NotificationPreference.objects.create(user=cls.user2)
+        cls.pref3 = NotificationPreference.objects.create(user=cls.user3)
     
     def test_comment_creates_notification_for_post_author(self):
         """Test that commenting on a post creates a notification for the author."""
         self.client.force_authenticate(user=self.user2)
         
         response = self.client.post(
-            f'/api/posts/{self.post.id}/comment/',
+            self.comment_url,
             {'content': 'Test comment'}
         )
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -298,7 +495,7 @@ class CommentNotificationIntegrationTests(TestCase):
         self.client.force_authenticate(user=self.user3)
         
         response = self.client.post(
-            f'/api/posts/{self.post.id}/comment/',
+            self.comment_url,
             {
                 'content': 'Reply to comment',
                 'parent_comment': comment.id
@@ -332,131 +529,167 @@ class CommentNotificationIntegrationTests(TestCase):
         )
         
         # Verify structure
-        self.assertTrue(comment1.is_reply() == False)
-        self.assertTrue(comment2.is_reply() == True)
+        self.assertFalse(comment1.is_reply())
+        self.assertTrue(comment2.is_reply())
         self.assertEqual(comment2.parent_comment, comment1)
         self.assertEqual(comment1.get_reply_count(), 1)
 
 
-class NotificationPreferenceTests(TestCase):
+class FollowNotificationTests(BaseSocialAPITestCase):
+    """Tests that following from either side notifies the followed user."""
+    
+    def get_follow_notifications(self):
+        """Return (recipient, actor) pairs for every follow notification."""
+        return set(
+            Notification.objects.filter(verb='follow')
+            .values_list('recipient__username', 'actor__username')
+        )
+    
+    def test_followers_add_notifies_followed_user(self):
+        """Test followed.followers.add(follower)."""
+        self.user1.followers.add(self.user2)
+        
+        self.assertEqual(self.get_follow_notifications(), {('user1', 'user2')})
+    
+    def test_following_add_notifies_followed_users(self):
+        """Test follower.following.add(followed, ...)."""
+        self.user2.following.add(self.user1, self.user3)
+        
+        self.assertEqual(
+            self.get_follow_notifications(),
+            {('user1', 'user2'), ('user3', 'user2')},
+        )
+    
+    def test_following_add_respects_each_preference(self):
+        """Test that a followed user with follow notifications off is skipped."""
+        NotificationPreference.objects.create(user=self.user3, notify_on_follow=False)
+        
+        self.user2.following.add(self.user1, self.user3)
+        
+        self.assertEqual(self.get_follow_notifications(), {('user1', 'user2')})
+        self.assertTrue(NotificationPreference.objects.filter(user=self.user1).exists())
+
+
+class NotificationPreferenceTests(BaseSocialAPITestCase):
     """Tests for notification preferences."""
     
     def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@test.com',
-            password='testpass123'
-        )
+        """Authenticate every request in this class as user1."""
+        self.client.force_authenticate(user=self.user1)
     
     def test_get_preferences_creates_default(self):
         """Test that getting preferences creates default settings if they don't exist."""
-        self.client.force_authenticate(user=self.user)
-        
-        response = self.client.get('/api/preferences/')
+        response = self.client.get(self.preferences_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(response.data['follow_notifications'])
-        self.assertTrue(response.data['like_notifications'])
+        self.assertEqual(
+            {key: response.data[key] for key in ('notify_on_follow', 'notify_on_like')},
+            {'notify_on_follow': True, 'notify_on_like': True},
+        )
     
     def test_update_preferences(self):
         """Test that preferences can be updated."""
-        self.client.force_authenticate(user=self.user)
-        
         response = self.client.patch(
-            '/api/preferences/',
+            self.preferences_url,
             {
-                'like_notifications': False,
-                'comment_notifications': False
+                'notify_on_like': False,
+                'notify_on_comment': False
             }
         )
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Verify preferences were updated
-        pref = NotificationPreference.objects.get(user=self.user)
-        self.assertFalse(pref.like_notifications)
-        self.assertFalse(pref.comment_notifications)
-        self.assertTrue(pref.follow_notifications)  # Should be unchanged
+        pref = NotificationPreference.objects.get(user=self.user1)
+        # notify_on_follow should be unchanged
+        self.assertEqual(
+            (pref.notify_on_like, pref.notify_on_comment, pref.notify_on_follow),
+            (False, False, True),
+        )
 
 
-class NotificationRetrievalTests(TestCase):
+class NotificationRetrievalTests(BaseSocialAPITestCase):
     """Tests for retrieving notifications via API."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        
-        self.user1 = User.objects.create_user(
-            username='user1',
-            email='user1@test.com',
-            password='testpass123'
-        )
-        self.user2 = User.objects.create_user(
-            username='user2',
-            email='user2@test.com',
-            password='testpass123'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
         
         # Create notifications
-        self.notif1 = Notification.objects.create(
-            recipient=self.user1,
-            actor=self.user2,
+        cls.notif1 = Notification.objects.create(
+            recipient=cls.user1,
+            actor=cls.user2,
             verb='like'
         )
-        self.notif2 = Notification.objects.create(
-            recipient=self.user1,
-            actor=self.user2,
+        cls.notif2 = Notification.objects.create(
+            recipient=cls.user1,
+            actor=cls.user2,
             verb='follow',
             is_read=True
         )
     
+    def setUp(self):
+        """Authenticate every request in this class as user1."""
+        self.client.force_authenticate(user=self.user1)
+    
     def test_list_notifications(self):
         """Test listing notifications for authenticated user."""
-        self.client.force_authenticate(user=self.user1)
-        
-        response = self.client.get('/api/notifications/')
+        response = self.client.get(self.notifications_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 2)
     
+    def test_list_notifications_query_count(self):
+        """Test that listing notifications does not query once per row."""
+        User.objects.bulk_create([
+            User(username=f'actor{i}', email=f'actor{i}@test.com')
+            for i in range(3)
+        ])
+        Notification.objects.bulk_create([
+            Notification(recipient=self.user1, actor=actor, verb='follow')
+            for actor in User.objects.filter(username__startswith='actor')
+        ])
+        
+        # One SELECT for the page; cursor pagination needs no COUNT
+        with self.assertNumQueries(1):
+            response = self.client.get(self.notifications_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 5)
+    
     def test_filter_unread_notifications(self):
         """Test filtering notifications by read status."""
-        self.client.force_authenticate(user=self.user1)
-        
-        response = self.client.get('/api/notifications/?unread=true')
+        response = self.client.get(f'{self.notifications_url}?unread=true')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)
-        self.assertEqual(response.data['results'][0]['id'], self.notif1.id)
+        self.assertEqual([n['id'] for n in response.data['results']], [self.notif1.id])
     
     def test_get_unread_count(self):
         """Test getting unread notification count."""
-        self.client.force_authenticate(user=self.user1)
-        
-        response = self.client.get('/api/notifications/unread_count/')
+        response = self.client.get(self.unread_count_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['unread_count'], 1)
     
     def test_mark_notification_read(self):
         """Test marking a notification as read."""
-        self.client.force_authenticate(user=self.user1)
-        
-        response = self.client.post(f'/api/notifications/{self.notif1.id}/mark_read/')
+        response = self.client.post(
+            reverse('notification-mark-read', kwargs={'id': self.notif1.pk})
+        )
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Verify notification was marked as read
-        self.notif1.refresh_from_db()
-        self.assertTrue(self.notif1.is_read)
+        self.assertTrue(
+            Notification.objects.filter(pk=self.notif1.pk)
+            .values_list('is_read', flat=True)
+            .get()
+        )
     
     def test_mark_all_read(self):
         """Test marking all notifications as read."""
-        self.client.force_authenticate(user=self.user1)
-        
-        response = self.client.post('/api/notifications/mark_all_read/')
+        response = self.client.post(self.mark_all_read_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
@@ -470,10 +703,8 @@ class NotificationRetrievalTests(TestCase):
     
     def test_bulk_action_mark_read(self):
         """Test bulk marking notifications as read."""
-        self.client.force_authenticate(user=self.user1)
-        
         response = self.client.post(
-            '/api/notifications/bulk_action/',
+            self.bulk_action_url,
             {
                 'notification_ids': [self.notif1.id, self.notif2.id],
                 'action': 'mark_read'
@@ -482,3 +713,111 @@ class NotificationRetrievalTests(TestCase):
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 2)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, SHARED_CACHE=True)
+class UnreadCountCacheTests(BaseSocialAPITestCase):
+    """Tests that the cached unread count follows every write path."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Give user1 two unread notifications from user2."""
+        super().setUpTestData()
+        cls.notif1 = Notification.objects.create(
+            recipient=cls.user1,
+            actor=cls.user2,
+            verb='like'
+        )
+        cls.notif2 = Notification.objects.create(
+            recipient=cls.user1,
+            actor=cls.user2,
+            verb='comment'
+        )
+    
+    def setUp(self):
+        """Start from an empty cache, authenticated as user1."""
+        cache.clear()
+        self.client.force_authenticate(user=self.user1)
+    
+    def get_unread_count(self):
+        """Fetch user1's unread count through the API."""
+        response = self.client.get(self.unread_count_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['unread_count']
+    
+    def test_unread_count_is_served_from_cache(self):
+        """Test that a warm count is answered without querying."""
+        self.assertEqual(self.get_unread_count(), 2)
+        
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_unread_count(), 2)
+    
+    @override_settings(SHARED_CACHE=False)
+    def test_unread_count_is_not_cached_without_shared_cache(self):
+        """Test that a per-process cache is never used for the count."""
+        self.assertEqual(self.get_unread_count(), 2)
+        
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get_unread_count(), 2)
+    
+    def test_mark_read_updates_cached_count(self):
+        """Test that marking one notification read refreshes the count."""
+        self.assertEqual(self.get_unread_count(), 2)
+        
+        self.client.post(reverse('notification-mark-read', kwargs={'id': self.notif1.pk}))
+        
+        self.assertEqual(self.get_unread_count(), 1)
+    
+    def test_mark_all_read_updates_cached_count(self):
+        """Test that marking everything read refreshes the count."""
+        self.assertEqual(self.get_unread_count(), 2)
+        
+        self.client.post(self.mark_all_read_url)
+        
+        self.assertEqual(self.get_unread_count(), 0)
+    
+    def test_bulk_actions_update_cached_count(self):
+        """Test that each bulk action refreshes the count."""
+        ids = [self.notif1.id, self.notif2.id]
+        cases = [('mark_read', 0), ('mark_unread', 2), ('delete', 0)]
+        for action, expected in cases:
+            with self.subTest(action=action):
+                # Warm the cache before each action
+                self.get_unread_count()
+                
+                self.client.post(
+                    self.bulk_action_url,
+                    {'notification_ids': ids, 'action': action}
+                )
+                
+                self.assertEqual(self.get_unread_count(), expected)
+    
+    def test_clear_all_deletes_in_one_query_and_updates_cached_count(self):
+        """Test that clear_all fast-deletes and refreshes the count."""
+        self.assertEqual(self.get_unread_count(), 2)
+        
+        # A single DELETE: no per-row SELECT or delete signals
+        with self.assertNumQueries(1):
+            response = self.client.delete(reverse('notification-clear-all'))
+        
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(self.get_unread_count(), 0)
+    
+    def test_deleting_actor_updates_cached_count(self):
+        """Test that notifications cascading with their actor refresh the count."""
+        self.assertEqual(self.get_unread_count(), 2)
+        
+        self.user2.delete()
+        
+        self.assertEqual(self.get_unread_count(), 0)
+    
+    def test_new_notifications_update_cached_count(self):
+        """Test that like and follow notifications refresh the count."""
+        self.assertEqual(self.get_unread_count(), 2)
+        
+        self.client.force_authenticate(user=self.user3)
+        self.client.post(self.like_url)
+        self.user1.followers.add(self.user3)
+        self.client.force_authenticate(user=self.user1)
+        
+        self.assertEqual(self.get_unread_count(), 4)